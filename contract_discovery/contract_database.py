@@ -6,6 +6,7 @@ Supports SQLite with advanced querying, filtering, and export capabilities.
 import sqlite3
 import csv
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -24,14 +25,24 @@ class ContractDatabase:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
         self.conn: Optional[sqlite3.Connection] = None
+        # Writes may arrive from worker threads (asyncio.to_thread); the
+        # connection is shared, so serialize write access with a lock
+        self._write_lock = threading.Lock()
+        self._fts_enabled = False
         self._initialize_database()
         
     def _initialize_database(self) -> None:
         """Initialize database tables."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self.conn.row_factory = sqlite3.Row  # Enable dict-like access
-            
+
+            # WAL lets readers proceed during writes and costs fewer
+            # fsyncs per commit; NORMAL synchronous is durable under WAL
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+
+
             # Create comprehensive contracts table
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS contracts (
@@ -64,6 +75,7 @@ class ContractDatabase:
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_name ON contracts(name)")
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bytecode_hash ON contracts(bytecode_hash)")
             self.conn.execute("CREATE INDEX IF NOT EXISTS idx_source_hash ON contracts(source_hash)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_chain_compiler ON contracts(chain, compiler_version)")
             
             # Create contract tags table for categorization
             self.conn.execute("""
@@ -75,6 +87,53 @@ class ContractDatabase:
                 )
             """)
             
+            # Full-text index over the searchable columns; triggers keep
+            # it in sync with the contracts table. FTS5 ships with the
+            # bundled SQLite, but guard anyway and fall back to LIKE scans
+            try:
+                fts_exists = self.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='contracts_fts'"
+                ).fetchone() is not None
+
+                self.conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS contracts_fts USING fts5(
+                        name, address, contract_summary,
+                        content='contracts', content_rowid='id'
+                    )
+                """)
+                self.conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS contracts_fts_insert
+                    AFTER INSERT ON contracts BEGIN
+                        INSERT INTO contracts_fts(rowid, name, address, contract_summary)
+                        VALUES (new.id, new.name, new.address, new.contract_summary);
+                    END
+                """)
+                self.conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS contracts_fts_delete
+                    AFTER DELETE ON contracts BEGIN
+                        INSERT INTO contracts_fts(contracts_fts, rowid, name, address, contract_summary)
+                        VALUES ('delete', old.id, old.name, old.address, old.contract_summary);
+                    END
+                """)
+                self.conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS contracts_fts_update
+                    AFTER UPDATE ON contracts BEGIN
+                        INSERT INTO contracts_fts(contracts_fts, rowid, name, address, contract_summary)
+                        VALUES ('delete', old.id, old.name, old.address, old.contract_summary);
+                        INSERT INTO contracts_fts(rowid, name, address, contract_summary)
+                        VALUES (new.id, new.name, new.address, new.contract_summary);
+                    END
+                """)
+
+                if not fts_exists:
+                    # Backfill the index for rows inserted before it existed
+                    self.conn.execute("INSERT INTO contracts_fts(contracts_fts) VALUES('rebuild')")
+
+                self._fts_enabled = True
+
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 unavailable, search will use LIKE scans: {str(e)}")
+
             self.conn.commit()
             logger.info("Database initialized successfully")
             
@@ -87,35 +146,37 @@ class ContractDatabase:
         try:
             if not self.conn:
                 return False
-                
-            # Check if contract already exists (by bytecode hash or source hash)
-            existing = self.conn.execute(
-                "SELECT id FROM contracts WHERE bytecode_hash = ? OR source_hash = ?",
-                (contract.bytecode_hash, contract.source_hash)
-            ).fetchone()
-            
-            if existing:
-                logger.debug(f"Contract {contract.address} already exists in database")
-                return False
-            
-            # Insert new contract
-            self.conn.execute("""
-                INSERT INTO contracts (
-                    address, name, source_code, bytecode, compiler_version,
-                    optimization, runs, constructor_arguments, abi, creation_txhash,
-                    block_number, chain, chain_id, verified_date, bytecode_hash,
-                    source_hash, contract_summary
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                contract.address, contract.name, contract.source_code, contract.bytecode,
-                contract.compiler_version, contract.optimization, contract.runs,
-                contract.constructor_arguments, contract.abi, contract.creation_txhash,
-                contract.block_number, contract.chain, contract.chain_id,
-                contract.verified_date, contract.bytecode_hash, contract.source_hash,
-                summary
-            ))
-            
-            self.conn.commit()
+
+            with self._write_lock:
+                # Check if contract already exists (by bytecode hash or source hash)
+                existing = self.conn.execute(
+                    "SELECT id FROM contracts WHERE bytecode_hash = ? OR source_hash = ?",
+                    (contract.bytecode_hash, contract.source_hash)
+                ).fetchone()
+
+                if existing:
+                    logger.debug(f"Contract {contract.address} already exists in database")
+                    return False
+
+                # Insert new contract
+                self.conn.execute("""
+                    INSERT INTO contracts (
+                        address, name, source_code, bytecode, compiler_version,
+                        optimization, runs, constructor_arguments, abi, creation_txhash,
+                        block_number, chain, chain_id, verified_date, bytecode_hash,
+                        source_hash, contract_summary
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    contract.address, contract.name, contract.source_code, contract.bytecode,
+                    contract.compiler_version, contract.optimization, contract.runs,
+                    contract.constructor_arguments, contract.abi, contract.creation_txhash,
+                    contract.block_number, contract.chain, contract.chain_id,
+                    contract.verified_date, contract.bytecode_hash, contract.source_hash,
+                    summary
+                ))
+
+                self.conn.commit()
+
             logger.info(f"Inserted contract: {contract.name} ({contract.address})")
             return True
             
@@ -123,40 +184,85 @@ class ContractDatabase:
             logger.error(f"Failed to insert contract {contract.address}: {str(e)}")
             return False
     
-    def get_contracts(self, 
+    def insert_contracts_bulk(self, rows: List[tuple]) -> tuple:
+        """Insert many contracts in a single transaction.
+
+        One commit per batch means one fsync instead of one per row, and
+        executemany parses the prepared statement once. Duplicates are
+        skipped by the UNIQUE hash constraints via INSERT OR IGNORE, so
+        no per-row existence probe is needed.
+
+        Args:
+            rows: List of (ContractData, summary) pairs
+
+        Returns:
+            Tuple of (inserted, skipped) counts
+        """
+        try:
+            if not self.conn or not rows:
+                return 0, len(rows) if rows else 0
+
+            params = [
+                (
+                    contract.address, contract.name, contract.source_code,
+                    contract.bytecode, contract.compiler_version,
+                    contract.optimization, contract.runs,
+                    contract.constructor_arguments, contract.abi,
+                    contract.creation_txhash, contract.block_number,
+                    contract.chain, contract.chain_id, contract.verified_date,
+                    contract.bytecode_hash, contract.source_hash, summary
+                )
+                for contract, summary in rows
+            ]
+
+            with self._write_lock:
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = self.conn.executemany("""
+                        INSERT OR IGNORE INTO contracts (
+                            address, name, source_code, bytecode, compiler_version,
+                            optimization, runs, constructor_arguments, abi, creation_txhash,
+                            block_number, chain, chain_id, verified_date, bytecode_hash,
+                            source_hash, contract_summary
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, params)
+                    inserted = max(cursor.rowcount, 0)
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+
+            skipped = len(rows) - inserted
+            logger.info(f"Bulk insert: {inserted} contracts inserted, {skipped} skipped")
+            return inserted, skipped
+
+        except Exception as e:
+            logger.error(f"Bulk insert failed: {str(e)}")
+            return 0, len(rows)
+
+    def get_contracts(self,
                      filters: Optional[Dict[str, Any]] = None,
                      limit: Optional[int] = None,
-                     offset: int = 0) -> List[Dict[str, Any]]:
-        """Get contracts with optional filtering."""
+                     offset: int = 0,
+                     columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get contracts with optional filtering.
+
+        Args:
+            filters: Optional filter criteria
+            limit: Maximum rows to return
+            offset: Rows to skip
+            columns: Columns to select; defaults to all. Projecting only
+                the displayed columns avoids reading the multi-KB
+                source_code/bytecode/abi fields per row.
+        """
         try:
             if not self.conn:
                 return []
-            
-            query = "SELECT * FROM contracts WHERE 1=1"
-            params: List[Any] = []
-            
-            # Apply filters
-            if filters:
-                if 'chain' in filters:
-                    query += " AND chain = ?"
-                    params.append(filters['chain'])
-                    
-                if 'name' in filters:
-                    query += " AND name LIKE ?"
-                    params.append(f"%{filters['name']}%")
-                    
-                if 'compiler_version' in filters:
-                    query += " AND compiler_version LIKE ?"
-                    params.append(f"%{filters['compiler_version']}%")
-                    
-                if 'optimization' in filters:
-                    query += " AND optimization = ?"
-                    params.append(filters['optimization'])
-                    
-                if 'address' in filters:
-                    query += " AND address = ?"
-                    params.append(filters['address'])
-            
+
+            select = ", ".join(columns) if columns else "*"
+            clause, params = self._filter_clause(filters)
+            query = f"SELECT {select} FROM contracts WHERE 1=1" + clause
+
             # Add ordering and limits
             query += " ORDER BY created_at DESC"
             
@@ -178,6 +284,117 @@ class ContractDatabase:
             logger.error(f"Failed to get contracts: {str(e)}")
             return []
     
+    def get_contracts_filtered(self,
+                               chain: Optional[str] = None,
+                               optimization: Optional[bool] = None,
+                               compiler: Optional[str] = None,
+                               limit: Optional[int] = None,
+                               columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get contracts with filters pushed down into SQL.
+
+        Unlike get_contracts(), the filters here map onto exact column
+        predicates so only matching rows are materialized in Python.
+
+        Args:
+            chain: Exact chain name, or None for all chains
+            optimization: Optimization flag, or None for both
+            compiler: Exact compiler version, or None for all
+            limit: Maximum rows to return
+            columns: Columns to select; defaults to all
+
+        Returns:
+            List of matching contracts
+        """
+        try:
+            if not self.conn:
+                return []
+
+            select = ", ".join(columns) if columns else "*"
+            query = f"SELECT {select} FROM contracts WHERE 1=1"
+            params: List[Any] = []
+
+            if chain is not None:
+                query += " AND chain = ?"
+                params.append(chain)
+
+            if optimization is not None:
+                query += " AND optimization = ?"
+                params.append(optimization)
+
+            if compiler is not None:
+                query += " AND compiler_version = ?"
+                params.append(compiler)
+
+            query += " ORDER BY created_at DESC"
+
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+
+            cursor = self.conn.execute(query, params)
+            contracts = [dict(row) for row in cursor.fetchall()]
+
+            logger.debug(f"Retrieved {len(contracts)} filtered contracts")
+            return contracts
+
+        except Exception as e:
+            logger.error(f"Failed to get filtered contracts: {str(e)}")
+            return []
+
+    def get_filter_options(self) -> Dict[str, List[str]]:
+        """Get distinct chain and compiler values for filter dropdowns."""
+        try:
+            if not self.conn:
+                return {'chains': [], 'compilers': []}
+
+            chains = [row['chain'] for row in self.conn.execute(
+                "SELECT DISTINCT chain FROM contracts ORDER BY chain"
+            ).fetchall()]
+            compilers = [row['compiler_version'] for row in self.conn.execute(
+                "SELECT DISTINCT compiler_version FROM contracts ORDER BY compiler_version"
+            ).fetchall()]
+            return {'chains': chains, 'compilers': compilers}
+
+        except Exception as e:
+            logger.error(f"Failed to get filter options: {str(e)}")
+            return {'chains': [], 'compilers': []}
+
+    @staticmethod
+    def _filter_clause(filters: Optional[Dict[str, Any]]) -> tuple:
+        """Build the shared WHERE-clause fragment and parameters.
+
+        Args:
+            filters: Optional filter criteria dictionary
+
+        Returns:
+            Tuple of (SQL fragment starting with " AND", parameter list)
+        """
+        clause = ""
+        params: List[Any] = []
+
+        if filters:
+            if 'chain' in filters:
+                clause += " AND chain = ?"
+                params.append(filters['chain'])
+
+            if 'name' in filters:
+                clause += " AND name LIKE ?"
+                params.append(f"%{filters['name']}%")
+
+            if 'compiler_version' in filters:
+                clause += " AND compiler_version LIKE ?"
+                params.append(f"%{filters['compiler_version']}%")
+
+            if 'optimization' in filters:
+                clause += " AND optimization = ?"
+                params.append(filters['optimization'])
+
+            if 'address' in filters:
+                clause += " AND address = ?"
+                params.append(filters['address'])
+
+        return clause, params
+
     def filter_contracts(self, **filters: Any) -> List[Dict[str, Any]]:
         """Filter contracts by various criteria.
         
@@ -189,6 +406,40 @@ class ContractDatabase:
         """
         return self.get_contracts(filters=filters)
     
+    def get_existing_addresses(self, pairs: set) -> set:
+        """Return the subset of (chain, address) pairs already stored.
+
+        Args:
+            pairs: Set of (chain, address) tuples to probe
+
+        Returns:
+            Set of (chain, address) tuples present in the database
+        """
+        try:
+            if not self.conn or not pairs:
+                return set()
+
+            existing: set = set()
+            pair_list = list(pairs)
+
+            # Chunk the IN-list to stay clear of SQLite's parameter limit
+            chunk_size = 400
+            for start in range(0, len(pair_list), chunk_size):
+                chunk = pair_list[start:start + chunk_size]
+                placeholders = ", ".join(["(?, ?)"] * len(chunk))
+                params: List[Any] = [value for pair in chunk for value in pair]
+                cursor = self.conn.execute(
+                    f"SELECT chain, address FROM contracts WHERE (chain, address) IN ({placeholders})",
+                    params
+                )
+                existing.update((row['chain'], row['address']) for row in cursor.fetchall())
+
+            return existing
+
+        except Exception as e:
+            logger.error(f"Failed to check existing addresses: {str(e)}")
+            return set()
+
     def get_contract_by_address(self, address: str) -> Optional[Dict[str, Any]]:
         """Get a specific contract by address."""
         try:
@@ -254,60 +505,105 @@ class ContractDatabase:
             return {}
     
     def export_to_csv(self, filename: str, filters: Optional[Dict[str, Any]] = None) -> bool:
-        """Export contracts to CSV file."""
+        """Export contracts to CSV file.
+
+        Rows stream straight from the SQLite cursor to the writer in
+        chunks, so peak memory stays flat regardless of table size
+        instead of materializing every row as a dict first.
+        """
         try:
-            contracts = self.get_contracts(filters)
-            
-            if not contracts:
-                logger.warning("No contracts to export")
+            if not self.conn:
                 return False
-            
+
+            fieldnames = [
+                'address', 'name', 'chain', 'compiler_version', 'optimization',
+                'runs', 'block_number', 'verified_date', 'contract_summary',
+                'bytecode_hash', 'source_hash'
+            ]
+
+            clause, params = self._filter_clause(filters)
+            query = (
+                f"SELECT {', '.join(fieldnames)} FROM contracts WHERE 1=1"
+                f"{clause} ORDER BY created_at DESC"
+            )
+            cursor = self.conn.execute(query, params)
+
             # Ensure exports directory exists
             Path(filename).parent.mkdir(parents=True, exist_ok=True)
-            
+
+            exported = 0
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'address', 'name', 'chain', 'compiler_version', 'optimization',
-                    'runs', 'block_number', 'verified_date', 'contract_summary',
-                    'bytecode_hash', 'source_hash'
-                ]
-                
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for contract in contracts:
-                    # Select only the fields we want to export
-                    export_data = {field: contract.get(field, '') for field in fieldnames}
-                    writer.writerow(export_data)
-            
-            logger.info(f"Exported {len(contracts)} contracts to {filename}")
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+
+                while True:
+                    rows = cursor.fetchmany(1000)
+                    if not rows:
+                        break
+                    writer.writerows(rows)
+                    exported += len(rows)
+
+            if not exported:
+                logger.warning("No contracts to export")
+                Path(filename).unlink(missing_ok=True)
+                return False
+
+            logger.info(f"Exported {exported} contracts to {filename}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to export to CSV: {str(e)}")
             return False
     
-    def search_contracts(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search contracts by name, address, or summary."""
+    def search_contracts(self, search_term: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Search contracts by name, address, or summary.
+
+        Uses the FTS5 inverted index when available, which touches only
+        the matching posting lists instead of LIKE-scanning every row.
+        Falls back to the LIKE scan when FTS is unavailable or the prefix
+        query finds nothing (FTS matches token prefixes, not arbitrary
+        mid-string substrings).
+        """
         try:
             if not self.conn:
                 return []
-            
+
+            if self._fts_enabled:
+                # Quoted prefix query; quoting keeps addresses and other
+                # terms with special characters valid FTS5 syntax
+                match = '"{}"*'.format(search_term.replace('"', '""'))
+                try:
+                    cursor = self.conn.execute("""
+                        SELECT c.* FROM contracts c
+                        JOIN contracts_fts f ON f.rowid = c.id
+                        WHERE contracts_fts MATCH ?
+                        ORDER BY c.created_at DESC
+                        LIMIT ?
+                    """, (match, limit))
+                    contracts = [dict(row) for row in cursor.fetchall()]
+
+                    if contracts:
+                        logger.debug(f"FTS search for '{search_term}' returned {len(contracts)} results")
+                        return contracts
+                except sqlite3.OperationalError:
+                    logger.debug(f"FTS query failed for '{search_term}', falling back to LIKE")
+
             query = """
-                SELECT * FROM contracts 
-                WHERE name LIKE ? 
-                   OR address LIKE ? 
+                SELECT * FROM contracts
+                WHERE name LIKE ?
+                   OR address LIKE ?
                    OR contract_summary LIKE ?
                 ORDER BY created_at DESC
+                LIMIT ?
             """
-            
+
             term = f"%{search_term}%"
-            cursor = self.conn.execute(query, (term, term, term))
+            cursor = self.conn.execute(query, (term, term, term, limit))
             contracts = [dict(row) for row in cursor.fetchall()]
-            
+
             logger.debug(f"Search for '{search_term}' returned {len(contracts)} results")
             return contracts
-            
+
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
             return []
@@ -4,6 +4,7 @@ Supports Ethereum and Base chains with comprehensive contract analysis.
 """
 
 import aiohttp
+import asyncio
 import logging
 import os
 import hashlib
@@ -78,8 +79,15 @@ class ContractData:
 class EnhancedBlockchainClient:
     """Enhanced blockchain client with bytecode analysis and deduplication."""
     
-    def __init__(self, chain_name: str):
-        """Initialize client for specific chain (ethereum or base)."""
+    def __init__(self, chain_name: str, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize client for specific chain (ethereum or base).
+
+        Args:
+            chain_name: Chain to connect to ('ethereum' or 'base')
+            session: Optional shared aiohttp session. When provided, the
+                client reuses it (and its connection pool) instead of
+                creating its own, and will not close it on cleanup.
+        """
         self.chain_name = chain_name.lower()
         
         # Set up chain-specific configuration
@@ -97,7 +105,8 @@ class EnhancedBlockchainClient:
         if not self.api_key:
             raise ValueError(f"No API key found for {self.chain_name}")
             
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.throttler = Throttler(rate_limit=4, period=1.0)  # 4 scans per second
         
         # Deduplication tracking
@@ -119,9 +128,9 @@ class EnhancedBlockchainClient:
         
     async def cleanup(self) -> None:
         """Cleanup resources."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
-            self.session = None
+        self.session = None
             
     async def _make_request(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Make throttled API request."""
@@ -235,20 +244,23 @@ class EnhancedBlockchainClient:
                 "0x940181a94A35A4569E4529A3CDfB74e38FD98631",  # AERO
             ]
         
-        for address in test_addresses[:limit]:
+        # Fetch all candidates concurrently; the throttler still caps the
+        # request rate, but requests overlap instead of waiting on each
+        # response before issuing the next
+        fetched = await asyncio.gather(
+            *(self._fetch_contract_data(address) for address in test_addresses[:limit]),
+            return_exceptions=True
+        )
+
+        for address, result in zip(test_addresses[:limit], fetched):
             try:
-                # Get contract source code
-                source_data = await self.get_contract_source(address)
-                if not source_data or not source_data.get('SourceCode'):
-                    logger.debug(f"Contract {address} is not verified")
+                if isinstance(result, BaseException):
+                    raise result
+                if result is None:
                     continue
-                
-                # Get contract bytecode
-                bytecode = await self.get_contract_bytecode(address)
-                if not bytecode:
-                    logger.debug(f"Could not retrieve bytecode for {address}")
-                    continue
-                
+
+                source_data, bytecode = result
+
                 # Generate hashes for deduplication
                 bytecode_hash = self._generate_bytecode_hash(bytecode)
                 source_hash = self._generate_source_hash(source_data.get('SourceCode', ''))
@@ -291,7 +303,30 @@ class EnhancedBlockchainClient:
             
         logger.info(f"Retrieved {len(contracts)} unique verified contracts from {self.chain_name}")
         return contracts
-        
+
+    async def _fetch_contract_data(self, address: str) -> Optional[tuple]:
+        """Fetch source code and bytecode for one address concurrently.
+
+        Returns:
+            (source_data, bytecode) tuple, or None if the contract is not
+            verified or the bytecode could not be retrieved
+        """
+        source_data, bytecode = await asyncio.gather(
+            self.get_contract_source(address),
+            self.get_contract_bytecode(address)
+        )
+
+        if not source_data or not source_data.get('SourceCode'):
+            logger.debug(f"Contract {address} is not verified")
+            return None
+
+        if not bytecode:
+            logger.debug(f"Could not retrieve bytecode for {address}")
+            return None
+
+        return source_data, bytecode
+
+
     async def get_contract_source(self, address: str) -> Optional[Dict[str, Any]]:
         """Get contract source code."""
         params = {
@@ -311,9 +346,15 @@ class EnhancedBlockchainClient:
 class BlockchainClientManager:
     """Enhanced blockchain client manager with deduplication."""
     
-    def __init__(self):
-        """Initialize the client manager."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize the client manager.
+
+        Args:
+            session: Optional shared aiohttp session passed through to every
+                chain client so all of them reuse one connection pool.
+        """
         self.clients: Dict[str, EnhancedBlockchainClient] = {}
+        self._session = session
         self._initialized = False
         
     async def initialize(self) -> None:
@@ -327,7 +368,7 @@ class BlockchainClientManager:
         
         for chain_name in supported_chains:
             try:
-                client = EnhancedBlockchainClient(chain_name)
+                client = EnhancedBlockchainClient(chain_name, session=self._session)
                 await client.initialize()
                 
                 if await client.test_connection():
@@ -360,11 +401,20 @@ class BlockchainClientManager:
         global_bytecode_hashes: set[str] = set()
         global_source_hashes: set[str] = set()
         
-        for chain_name, client in self.clients.items():
+        # Each chain hits a different API host, so fetch them in parallel;
+        # per-chain throttlers keep each host within its rate limit
+        chain_names = list(self.clients.keys())
+        chain_results = await asyncio.gather(
+            *(self.clients[name].get_verified_contracts(limit=limit_per_chain)
+              for name in chain_names),
+            return_exceptions=True
+        )
+
+        for chain_name, contracts in zip(chain_names, chain_results):
             try:
-                logger.info(f"Fetching contracts from {chain_name}...")
-                contracts = await client.get_verified_contracts(limit=limit_per_chain)
-                
+                if isinstance(contracts, BaseException):
+                    raise contracts
+
                 # Apply global deduplication
                 unique_contracts: List[ContractData] = []
                 for contract in contracts:
@@ -8,47 +8,74 @@ import json
 import base64
 import hashlib
 import aiohttp
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _json_dumps(data: Any) -> Union[str, bytes]:
+    """Serialize data to JSON, preferring orjson's C encoder when installed.
+
+    Contract payloads embed multi-KB source code strings, where orjson is
+    several times faster than the stdlib encoder and skips the intermediate
+    str allocation (bytes go straight into base64 encoding).
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2)
+
 class GitHubStorageManager:
     """Manages contract storage in GitHub repository."""
     
-    def __init__(self) -> None:
-        """Initialize GitHub storage manager."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
+        """Initialize GitHub storage manager.
+
+        Args:
+            session: Optional shared aiohttp session. When provided, requests
+                reuse its connection pool and the session is not closed on
+                cleanup; auth headers are sent per-request instead.
+        """
         self.github_token: Optional[str] = os.getenv('GITHUB_TOKEN')
         self.github_repo: str = os.getenv('GITHUB_REPO', 'joshm1211/web3-loc-contracts')
         self.branch: str = 'main'
         self.base_url: str = 'https://api.github.com'
-        self.session: Optional[aiohttp.ClientSession] = None
-        
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._headers: Dict[str, str] = {
+            'Authorization': f'token {self.github_token}',
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'Web3.LOC-Storage/1.0'
+        }
+
         if not self.github_token:
             logger.warning("No GitHub token found. GitHub storage will not be available.")
-            
+
     async def initialize(self) -> None:
         """Initialize the HTTP session."""
         if not self.github_token:
             return
-            
-        self.session = aiohttp.ClientSession(
-            headers={
-                'Authorization': f'token {self.github_token}',
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'Web3.LOC-Storage/1.0'
-            },
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
-        
+
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._owns_session = True
+
         # Ensure repository structure exists
         await self._ensure_repo_structure()
-        
+
     async def cleanup(self) -> None:
         """Cleanup resources."""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+        self.session = None
             
     async def _ensure_repo_structure(self) -> None:
         """Ensure required directories exist in repository."""
@@ -70,7 +97,7 @@ class GitHubStorageManager:
         try:
             # Check if directory exists by trying to get its contents
             url = f"{self.base_url}/repos/{self.github_repo}/contents/{path}"
-            async with self.session.get(url) as response:
+            async with self.session.get(url, headers=self._headers) as response:
                 if response.status == 404:
                     # Directory doesn't exist, create it with a .gitkeep file
                     await self._create_file(f"{path}/.gitkeep", "", f"Create {path} directory")
@@ -85,7 +112,7 @@ class GitHubStorageManager:
             
         try:
             url = f"{self.base_url}/repos/{self.github_repo}/contents/{file_path}"
-            async with self.session.get(url) as response:
+            async with self.session.get(url, headers=self._headers) as response:
                 if response.status == 200:
                     data = await response.json()
                     return data.get('sha')
@@ -93,19 +120,20 @@ class GitHubStorageManager:
             pass
         return None
         
-    async def _create_file(self, file_path: str, content: str, commit_message: str) -> bool:
+    async def _create_file(self, file_path: str, content: Union[str, bytes], commit_message: str) -> bool:
         """Create or update file in repository."""
         if not self.session:
             return False
-            
+
         try:
             url = f"{self.base_url}/repos/{self.github_repo}/contents/{file_path}"
-            
+
             # Get existing file SHA if it exists
             existing_sha = await self._get_file_sha(file_path)
-            
+
             # Encode content
-            encoded_content = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+            raw = content.encode('utf-8') if isinstance(content, str) else content
+            encoded_content = base64.b64encode(raw).decode('ascii')
             
             data: Dict[str, Any] = {
                 'message': commit_message,
@@ -116,7 +144,7 @@ class GitHubStorageManager:
             if existing_sha:
                 data['sha'] = existing_sha
                 
-            async with self.session.put(url, json=data) as response:
+            async with self.session.put(url, json=data, headers=self._headers) as response:
                 if response.status in [200, 201]:
                     logger.debug(f"Successfully created/updated file: {file_path}")
                     return True
@@ -136,7 +164,7 @@ class GitHubStorageManager:
             
         try:
             url = f"{self.base_url}/repos/{self.github_repo}/contents/{file_path}"
-            async with self.session.get(url) as response:
+            async with self.session.get(url, headers=self._headers) as response:
                 if response.status == 200:
                     data = await response.json()
                     content = base64.b64decode(data['content']).decode('utf-8')
@@ -167,7 +195,7 @@ class GitHubStorageManager:
             
             # Store contract data
             file_path = f"contracts/{chain}/{contract_id}.json"
-            content = json.dumps(contract_data, indent=2)
+            content = _json_dumps(contract_data)
             commit_message = f"Add contract {contract_data.get('name', 'Unknown')} ({contract_data['address']})"
             
             success = await self._create_file(file_path, content, commit_message)
@@ -217,7 +245,7 @@ class GitHubStorageManager:
             index_data['last_updated'] = datetime.now().isoformat()
             
             # Store updated index
-            content = json.dumps(index_data, indent=2)
+            content = _json_dumps(index_data)
             await self._create_file(index_path, content, f"Update {chain} contract index")
             
         except Exception as e:
@@ -246,29 +274,37 @@ class GitHubStorageManager:
         try:
             contracts: List[Dict[str, Any]] = []
             chains_to_search = [chain] if chain else ['ethereum', 'base']
-            
-            for search_chain in chains_to_search:
-                index_path = f"indexes/{search_chain}_index.json"
-                content = await self._get_file_content(index_path)
-                
-                if content:
-                    index_data: Dict[str, Any] = json.loads(content)
-                    
-                    for contract_entry in index_data.get('contracts', []):
-                        # Apply filters
-                        if name_filter and name_filter.lower() not in contract_entry.get('name', '').lower():
-                            continue
-                            
-                        if address_filter and address_filter.lower() not in contract_entry.get('address', '').lower():
-                            continue
-                            
-                        contracts.append(contract_entry)
-                        
-                        if len(contracts) >= limit:
-                            break
-                            
-            return contracts[:limit]
-            
+
+            # The per-chain indexes carry only metadata columns, so the
+            # filters run before any full contract blob is downloaded;
+            # fetch the indexes themselves concurrently
+            contents = await asyncio.gather(
+                *(self._get_file_content(f"indexes/{search_chain}_index.json")
+                  for search_chain in chains_to_search)
+            )
+
+            for content in contents:
+                if not content:
+                    continue
+
+                index_data: Dict[str, Any] = json.loads(content)
+
+                for contract_entry in index_data.get('contracts', []):
+                    # Apply filters
+                    if name_filter and name_filter.lower() not in contract_entry.get('name', '').lower():
+                        continue
+
+                    if address_filter and address_filter.lower() not in contract_entry.get('address', '').lower():
+                        continue
+
+                    contracts.append(contract_entry)
+
+                    if len(contracts) >= limit:
+                        return contracts
+
+            return contracts
+
+
         except Exception as e:
             logger.error(f"Error searching contracts: {str(e)}")
             return []
@@ -282,10 +318,12 @@ class GitHubStorageManager:
                 'last_updated': None
             }
             
-            for chain in ['ethereum', 'base']:
-                index_path = f"indexes/{chain}_index.json"
-                content = await self._get_file_content(index_path)
-                
+            chains = ['ethereum', 'base']
+            contents = await asyncio.gather(
+                *(self._get_file_content(f"indexes/{chain}_index.json") for chain in chains)
+            )
+
+            for chain, content in zip(chains, contents):
                 if content:
                     index_data: Dict[str, Any] = json.loads(content)
                     contract_count = len(index_data.get('contracts', []))
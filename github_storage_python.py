@@ -9,6 +9,10 @@ import asyncio
 import json
 import csv
 import io
+import os
+import sqlite3
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
@@ -26,11 +30,84 @@ class GitHubStorage:
         self.cache = {}
         self.is_online = False
         self.session = None
+        # Disk-backed ETag cache: fresh entries are served locally, stale
+        # ones are revalidated with If-None-Match so unchanged documents
+        # cost a 304 instead of a full body transfer
+        self.cache_ttl = int(os.getenv('MOBILE_CACHE_TTL', 300))
+        self.cache_path = os.getenv('MOBILE_CACHE_PATH', './web3loc_cache.sqlite')
+        self._cache_conn = None
+    
+    def _http_cache(self):
+        """Open (once) the sqlite connection backing the HTTP response cache"""
+        if self._cache_conn is None:
+            self._cache_conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                "url TEXT PRIMARY KEY, etag TEXT, body BLOB, fetched_at REAL)"
+            )
+            self._cache_conn.commit()
+        return self._cache_conn
+    
+    async def _get_json(self, url):
+        """GET a JSON document, revalidating through the ETag cache"""
+        await self.initialize()
+        
+        cache = self._http_cache()
+        row = cache.execute(
+            "SELECT etag, body, fetched_at FROM http_cache WHERE url = ?", (url,)
+        ).fetchone()
+        
+        headers = {}
+        if row:
+            etag, body, fetched_at = row
+            if time.time() - fetched_at < self.cache_ttl:
+                return json.loads(body)
+            if etag:
+                headers['If-None-Match'] = etag
+        
+        try:
+            async with self.session.get(url, headers=headers) as response:
+                if response.status == 304 and row:
+                    cache.execute(
+                        "UPDATE http_cache SET fetched_at = ? WHERE url = ?",
+                        (time.time(), url)
+                    )
+                    cache.commit()
+                    return json.loads(row[1])
+                
+                if not response.ok:
+                    return None
+                
+                body = await response.read()
+                cache.execute(
+                    "INSERT OR REPLACE INTO http_cache (url, etag, body, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (url, response.headers.get('ETag'), body, time.time())
+                )
+                cache.commit()
+                return json.loads(body)
+        except aiohttp.ClientError as error:
+            logging.error(f"Request failed for {url}: {error}")
+            # Fall back to a stale cached body when offline
+            if row:
+                return json.loads(row[1])
+            return None
         
     async def initialize(self):
         """Initialize HTTP session"""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            # One pooled session for the life of the app: keep-alive and the
+            # DNS cache make repeated GitHub fetches skip handshake costs
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
     
     async def close(self):
         """Close HTTP session"""
@@ -133,17 +210,12 @@ class GitHubStorage:
             return self.cache[cache_key]
         
         try:
-            await self.initialize()
-            
             url = f"{self.raw_base}/contracts/{chain}/contract_{contract_id}.json"
-            async with self.session.get(url) as response:
-                
-                if not response.ok:
-                    return None
-                
-                contract_data = await response.json()
+            contract_data = await self._get_json(url)
+            
+            if contract_data is not None:
                 self.cache[cache_key] = contract_data
-                return contract_data
+            return contract_data
                 
         except Exception as error:
             logging.error(f"Error getting contract: {error}")
@@ -152,20 +224,18 @@ class GitHubStorage:
     async def get_contract_statistics(self) -> Dict[str, Any]:
         """Get contract statistics"""
         try:
-            await self.initialize()
-            
             url = f"{self.raw_base}/index/statistics.json"
-            async with self.session.get(url) as response:
-                
-                if response.ok:
-                    return await response.json()
-                else:
-                    index = await self.get_contract_index()
-                    return index.get('statistics', {
-                        'total_contracts': 0,
-                        'chains': {'ethereum': 0, 'base': 0},
-                        'last_updated': None
-                    })
+            stats = await self._get_json(url)
+            
+            if stats is not None:
+                return stats
+            
+            index = await self.get_contract_index()
+            return index.get('statistics', {
+                'total_contracts': 0,
+                'chains': {'ethereum': 0, 'base': 0},
+                'last_updated': None
+            })
                     
         except Exception:
             return {
@@ -177,22 +247,20 @@ class GitHubStorage:
     async def get_contract_index(self) -> Dict[str, Any]:
         """Get contract index"""
         try:
-            await self.initialize()
-            
             url = f"{self.raw_base}/index/contract_index.json"
-            async with self.session.get(url) as response:
-                
-                if response.ok:
-                    return await response.json()
-                else:
-                    return {
-                        'contracts': [],
-                        'statistics': {
-                            'total_contracts': 0,
-                            'chains': {'ethereum': 0, 'base': 0},
-                            'last_updated': None
-                        }
-                    }
+            index = await self._get_json(url)
+            
+            if index is not None:
+                return index
+            
+            return {
+                'contracts': [],
+                'statistics': {
+                    'total_contracts': 0,
+                    'chains': {'ethereum': 0, 'base': 0},
+                    'last_updated': None
+                }
+            }
                     
         except Exception:
             return {
@@ -204,22 +272,62 @@ class GitHubStorage:
                 }
             }
     
+    async def get_contracts_bulk(self, refs: List[Dict[str, Any]], concurrency: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """Fetch full contract documents concurrently.
+
+        The fan-out is bounded by a semaphore so a large batch cannot
+        exhaust the connection pool or trip GitHub's rate limit; already
+        cached contracts resolve without a request.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(ref):
+            async with sem:
+                return await self.get_contract(ref.get('address', ''), ref.get('chain', ''))
+
+        return await asyncio.gather(*(fetch(ref) for ref in refs))
+
     async def get_recent_contracts(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent contracts"""
         try:
             contracts = await self.search_contracts({'limit': limit})
-            
+
             # Sort by stored_at date
             contracts.sort(
                 key=lambda x: datetime.fromisoformat(x.get('stored_at', '1970-01-01T00:00:00Z').replace('Z', '+00:00')),
                 reverse=True
             )
-            
-            return contracts[:limit]
-            
+            contracts = contracts[:limit]
+
+            # Warm the full documents in parallel: the critical path is
+            # ~1-2 round trips instead of one per contract, and the first
+            # tap after a refresh is then a cache hit
+            await self.get_contracts_bulk(contracts)
+
+            return contracts
+
         except Exception:
             return []
     
+    CSV_HEADERS = [
+        'Address', 'Chain', 'Name', 'Type', 'Verified',
+        'Compiler', 'Optimized', 'Stored Date'
+    ]
+    
+    @staticmethod
+    def _csv_row(contract: Dict[str, Any]) -> List[str]:
+        """Build one CSV row for a contract"""
+        return [
+            contract.get('address', ''),
+            contract.get('chain', ''),
+            contract.get('name', 'Unknown'),
+            contract.get('type', 'other'),
+            'Yes' if contract.get('verified') else 'No',
+            contract.get('compiler_version', 'Unknown'),
+            'Yes' if contract.get('optimization') else 'No',
+            datetime.fromisoformat(contract.get('stored_at', '1970-01-01T00:00:00Z').replace('Z', '+00:00')).strftime('%Y-%m-%d') if contract.get('stored_at') else ''
+        ]
+    
     async def export_contracts_csv(self, filters: Optional[Dict[str, Any]] = None) -> str:
         """Export contracts as CSV string"""
         if filters is None:
@@ -234,29 +342,38 @@ class GitHubStorage:
             # Create CSV content
             output = io.StringIO()
             writer = csv.writer(output)
+            writer.writerow(self.CSV_HEADERS)
+            # writerows drives the row loop from C instead of one
+            # writerow call per contract
+            writer.writerows(map(self._csv_row, contracts))
             
-            # Headers
-            headers = [
-                'Address', 'Chain', 'Name', 'Type', 'Verified',
-                'Compiler', 'Optimized', 'Stored Date'
-            ]
-            writer.writerow(headers)
+            return output.getvalue()
             
-            # Data rows
-            for contract in contracts:
-                row = [
-                    contract.get('address', ''),
-                    contract.get('chain', ''),
-                    contract.get('name', 'Unknown'),
-                    contract.get('type', 'other'),
-                    'Yes' if contract.get('verified') else 'No',
-                    contract.get('compiler_version', 'Unknown'),
-                    'Yes' if contract.get('optimization') else 'No',
-                    datetime.fromisoformat(contract.get('stored_at', '1970-01-01T00:00:00Z').replace('Z', '+00:00')).strftime('%Y-%m-%d') if contract.get('stored_at') else ''
-                ]
-                writer.writerow(row)
+        except Exception as error:
+            raise error
+    
+    async def export_contracts_csv_to_file(self, filters: Optional[Dict[str, Any]], out_path: str) -> str:
+        """Export contracts as CSV, streaming rows straight to a file.
+        
+        Rows are written to the open file handle as they are produced, so
+        peak memory stays at one write buffer instead of the full CSV
+        string plus its encoded copy.
+        """
+        if filters is None:
+            filters = {}
+        
+        try:
+            contracts = await self.search_contracts(filters)
             
-            return output.getvalue()
+            if not contracts:
+                raise Exception('No contracts found to export')
+            
+            with open(out_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(self.CSV_HEADERS)
+                writer.writerows(map(self._csv_row, contracts))
+            
+            return out_path
             
         except Exception as error:
             raise error
@@ -359,39 +476,34 @@ class GitHubStorage:
                 'verification_rate': 0
             }
             
-            # Count by chain
-            for contract in contracts:
-                chain = contract.get('chain', 'unknown')
-                analytics['by_chain'][chain] = analytics['by_chain'].get(chain, 0) + 1
-            
-            # Count by type
+            # Column-wise counting: Counter consumes each generator at C
+            # speed instead of a dict-update loop per contract
+            analytics['by_chain'] = dict(Counter(
+                c.get('chain', 'unknown') for c in contracts
+            ))
+            analytics['by_type'] = dict(Counter(
+                c.get('type', 'other') for c in contracts
+            ))
+            
+            # Single pass for dates and verification. stored_at is ISO 8601,
+            # so the first 10 characters are already the YYYY-MM-DD bucket —
+            # no datetime parse per contract
+            date_counts = Counter()
+            verified_count = 0
             for contract in contracts:
-                contract_type = contract.get('type', 'other')
-                analytics['by_type'][contract_type] = analytics['by_type'].get(contract_type, 0) + 1
+                if contract.get('verified'):
+                    verified_count += 1
+                stored_at = contract.get('stored_at')
+                if stored_at:
+                    date_counts[stored_at[:10]] += 1
             
-            # Count by date (last 30 days)
             now = datetime.now()
             last_30_days = {}
-            
             for i in range(30):
-                date = now - timedelta(days=i)
-                date_str = date.strftime('%Y-%m-%d')
-                last_30_days[date_str] = 0
-            
-            for contract in contracts:
-                if contract.get('stored_at'):
-                    try:
-                        stored_date = datetime.fromisoformat(contract['stored_at'].replace('Z', '+00:00'))
-                        date_str = stored_date.strftime('%Y-%m-%d')
-                        if date_str in last_30_days:
-                            last_30_days[date_str] += 1
-                    except:
-                        pass
+                date_str = (now - timedelta(days=i)).strftime('%Y-%m-%d')
+                last_30_days[date_str] = date_counts.get(date_str, 0)
             
             analytics['by_date'] = last_30_days
-            
-            # Calculate verification rate
-            verified_count = sum(1 for c in contracts if c.get('verified'))
             analytics['verification_rate'] = round((verified_count / len(contracts)) * 100) if contracts else 0
             
             return analytics
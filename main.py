@@ -6,6 +6,8 @@ Integrates all components for a production-ready blockchain contract discovery p
 import asyncio
 import logging
 import sys
+
+import aiohttp
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -38,7 +40,12 @@ class Web3LOCSystem:
         self.client_manager = None
         self.database = ContractDatabase()
         self.readme_generator = ContractREADMEGenerator()
-        self.github_storage = GitHubStorageManager()
+        self.github_storage = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._available_chains: tuple = ()
+        self._client_count = 0
+        # Created lazily so the system can be constructed outside a loop
+        self._init_lock: Optional[asyncio.Lock] = None
         self.is_initialized = False
         
         # Create necessary directories
@@ -56,15 +63,48 @@ class Web3LOCSystem:
             Path(directory).mkdir(parents=True, exist_ok=True)
     
     async def initialize(self):
-        """Initialize the system components."""
+        """Initialize the system components.
+
+        Safe to call repeatedly and from concurrent coroutines: a lock
+        collapses simultaneous callers into a single initialization.
+        """
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+
+        async with self._init_lock:
+            if self.is_initialized:
+                return
+            await self._do_initialize()
+
+    async def _do_initialize(self):
+        """Perform the actual component initialization."""
         try:
             logger.info("Initializing Web3.LOC system...")
-            
+
+            # One shared HTTP session so every component reuses the same
+            # connection pool and DNS cache instead of handshaking separately
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={'User-Agent': 'Web3.LOC-ContractDiscovery/3.0'}
+            )
+
             # Initialize blockchain client manager
-            self.client_manager = BlockchainClientManager()
+            self.client_manager = BlockchainClientManager(session=self._session)
             await self.client_manager.initialize()
-            
+
+            # Connected chains don't change after init; cache them so
+            # stats polling doesn't rebuild the list on every call
+            self._available_chains = tuple(self.client_manager.get_available_chains())
+            self._client_count = len(self.client_manager.clients)
+
             # Initialize GitHub storage
+            self.github_storage = GitHubStorageManager(session=self._session)
             await self.github_storage.initialize()
             
             # Verify database connection
@@ -94,9 +134,8 @@ class Web3LOCSystem:
         Returns:
             Discovery results summary
         """
-        if not self.is_initialized:
-            await self.initialize()
-        
+        await self.initialize()
+
         logger.info(f"Starting contract discovery: {limit_per_chain} contracts per chain")
         
         try:
@@ -156,19 +195,33 @@ class Web3LOCSystem:
             'errors': 0,
             'readme_files': []
         }
-        
-        for contract in contracts:
+
+        # Drop in-batch duplicates, then skip anything already stored so
+        # known contracts never reach the analyze/insert path
+        unique_contracts = list({(c.chain, c.address): c for c in contracts}.values())
+        results['duplicates_found'] += len(contracts) - len(unique_contracts)
+
+        existing = self.database.get_existing_addresses(
+            {(c.chain, c.address) for c in unique_contracts}
+        )
+
+        for contract in unique_contracts:
+            if (contract.chain, contract.address) in existing:
+                results['duplicates_found'] += 1
+                logger.info(f"Skipping known contract: {contract.name} ({contract.address[:10]}...)")
+                continue
             try:
-                # Generate contract analysis and summary
-                summary = ContractAnalyzer.analyze_contract(contract)
-                
+                # Analysis and the sqlite insert are synchronous; run them on
+                # the default executor so GitHub uploads keep making progress
+                summary = await asyncio.to_thread(ContractAnalyzer.analyze_contract, contract)
+
                 # Try to insert into database
-                if self.database.insert_contract(contract, summary):
+                if await asyncio.to_thread(self.database.insert_contract, contract, summary):
                     results['contracts_added'] += 1
                     logger.info(f"Added contract: {contract.name} ({contract.address[:10]}...)")
                     
                     # Store in GitHub if available
-                    if self.github_storage.is_available():
+                    if self.github_storage and self.github_storage.is_available():
                         try:
                             contract_data = contract.to_dict()
                             contract_data['summary'] = summary
@@ -250,8 +303,8 @@ class Web3LOCSystem:
         
         # Add system-specific stats
         if self.client_manager:
-            stats['available_chains'] = self.client_manager.get_available_chains()
-            stats['client_status'] = len(self.client_manager.clients)
+            stats['available_chains'] = list(self._available_chains)
+            stats['client_status'] = self._client_count
         
         stats['system_initialized'] = self.is_initialized
         stats['last_updated'] = datetime.now().isoformat()
@@ -261,7 +314,7 @@ class Web3LOCSystem:
     def _log_system_status(self):
         """Log current system status."""
         if self.client_manager:
-            chains = self.client_manager.get_available_chains()
+            chains = self._available_chains
             logger.info(f"Connected to {len(chains)} blockchain clients: {', '.join(chains)}")
         
         stats = self.database.get_statistics()
@@ -274,6 +327,9 @@ class Web3LOCSystem:
             await self.client_manager.cleanup()
         if self.github_storage:
             await self.github_storage.cleanup()
+        if self._session:
+            await self._session.close()
+            self._session = None
         logger.info("Web3.LOC system cleaned up")
 
 class Web3LOCCLIInterface:
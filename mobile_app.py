@@ -11,49 +11,74 @@ from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
 from kivy.uix.popup import Popup
 from kivy.uix.spinner import Spinner
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.clock import Clock
+from kivy.metrics import dp
 import asyncio
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from github_storage_python import GitHubStorage
 
+# One bounded pool for blocking file writes. Reusing these threads avoids a
+# stack allocation per download and caps memory under rapid taps; async work
+# stays on the shared event loop.
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
 
-class ContractCard(BoxLayout):
-    """Widget for displaying contract information"""
+# Supported chains form a tiny closed set, so display and canonical forms
+# are table lookups instead of per-call Unicode .title()/.lower() scans
+_CHAIN_DISPLAY = {'ethereum': 'Ethereum', 'base': 'Base'}
+_CHAIN_CANON = {'All Chains': 'all', 'Ethereum': 'ethereum', 'Base': 'base'}
+
+
+class ContractCard(RecycleDataViewBehavior, BoxLayout):
+    """Recyclable widget for displaying contract information.
+    
+    The RecycleView instantiates only enough cards to fill the screen and
+    rebinds them to new contracts via refresh_view_attrs, so child widgets
+    are built exactly once per card.
+    """
     
-    def __init__(self, contract_data, storage, **kwargs):
+    def __init__(self, **kwargs):
+        # Passing layout settings through the constructor applies them in one
+        # pass instead of firing a property dispatch per assignment
+        kwargs.setdefault('orientation', 'vertical')
+        kwargs.setdefault('size_hint_y', None)
+        kwargs.setdefault('height', '150dp')
+        kwargs.setdefault('spacing', '5dp')
         super().__init__(**kwargs)
-        self.orientation = 'vertical'
-        self.size_hint_y = None
-        self.height = '150dp'
-        self.spacing = '5dp'
-        
-        self.contract = contract_data
-        self.storage = storage
-        
-        # Contract info
-        name = contract_data.get('name', 'Unknown')
-        address = contract_data.get('address', '')[:20] + '...'
-        chain = contract_data.get('chain', '').title()
-        
-        self.add_widget(Label(
-            text=f"[b]{name}[/b]", 
+
+        self.contract = {}
+        self.storage = None
+        self.loop = None
+        self.app = None
+        
+        # Contract info labels, mutated on rebind
+        self.name_label = Label(
+            text='',
             markup=True,
             size_hint_y=None,
             height='30dp'
-        ))
+        )
+        self.add_widget(self.name_label)
         
-        self.add_widget(Label(
-            text=f"Address: {address}",
+        self.address_label = Label(
+            text='',
             size_hint_y=None,
             height='25dp'
-        ))
+        )
+        self.add_widget(self.address_label)
         
-        self.add_widget(Label(
-            text=f"Chain: {chain}",
+        self.chain_label = Label(
+            text='',
             size_hint_y=None,
             height='25dp'
-        ))
+        )
+        self.add_widget(self.chain_label)
         
         # Export buttons
         button_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height='40dp')
@@ -72,60 +97,69 @@ class ContractCard(BoxLayout):
         
         self.add_widget(button_layout)
     
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this card to a contract when the view is recycled"""
+        self.contract = data['contract']
+        self.storage = data['storage']
+        self.loop = data['loop']
+        self.app = data['app']
+        
+        contract = self.contract
+        self.name_label.text = contract['_display_name']
+        self.address_label.text = contract['_display_addr']
+        self.chain_label.text = contract['_display_chain']
+
+        return super().refresh_view_attrs(rv, index, data)
+    
     def download_sol(self, instance):
         """Download contract as .sol file"""
-        def run_download():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                contract_id = self.contract['address']
-                chain = self.contract['chain']
-                
-                sol_content = loop.run_until_complete(
-                    self.storage.export_contract_sol(contract_id, chain)
-                )
-                
-                filename = f"{self.contract.get('name', 'contract')}_{contract_id[:8]}.sol"
-                self.storage.save_file(sol_content, filename, './downloads/')
-                
-                Clock.schedule_once(lambda dt: self.show_popup(f"Downloaded: {filename}"), 0)
-                
-            except Exception as e:
-                Clock.schedule_once(lambda dt: self.show_popup(f"Error: {str(e)}"), 0)
-        
-        threading.Thread(target=run_download).start()
+        contract_id = self.contract['address']
+        chain = self.contract['chain']
+        filename = f"{self.contract.get('name', 'contract')}_{contract_id[:8]}.sol"
+        
+        future = asyncio.run_coroutine_threadsafe(
+            self.storage.export_contract_sol(contract_id, chain), self.loop
+        )
+        future.add_done_callback(partial(self._on_download_done, filename=filename))
     
     def download_readme(self, instance):
         """Download contract as README file"""
-        def run_download():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                contract_id = self.contract['address']
-                chain = self.contract['chain']
-                
-                readme_content = loop.run_until_complete(
-                    self.storage.export_contract_readme(contract_id, chain)
-                )
-                
-                filename = f"{self.contract.get('name', 'contract')}_{contract_id[:8]}_README.md"
-                self.storage.save_file(readme_content, filename, './downloads/')
-                
-                Clock.schedule_once(lambda dt: self.show_popup(f"Downloaded: {filename}"), 0)
-                
-            except Exception as e:
-                Clock.schedule_once(lambda dt: self.show_popup(f"Error: {str(e)}"), 0)
-        
-        threading.Thread(target=run_download).start()
+        contract_id = self.contract['address']
+        chain = self.contract['chain']
+        filename = f"{self.contract.get('name', 'contract')}_{contract_id[:8]}_README.md"
+        
+        future = asyncio.run_coroutine_threadsafe(
+            self.storage.export_contract_readme(contract_id, chain), self.loop
+        )
+        future.add_done_callback(partial(self._on_download_done, filename=filename))
+    
+    def _on_download_done(self, future, filename):
+        """Hand a finished download off for saving (runs on the loop thread)"""
+        try:
+            content = future.result()
+        except Exception as e:
+            Clock.schedule_once(partial(self._show_popup_later, f"Error: {str(e)}"), 0)
+            return
+
+        # The blocking file write goes to the bounded pool, not the loop thread
+        _IO_POOL.submit(self._save_download, content, filename)
+
+    def _save_download(self, content, filename):
+        """Write a downloaded file to disk and report via popup"""
+        try:
+            self.storage.save_file(content, filename, './downloads/')
+            message = f"Downloaded: {filename}"
+        except Exception as e:
+            message = f"Error: {str(e)}"
+
+        Clock.schedule_once(partial(self._show_popup_later, message), 0)
     
     def show_info(self, instance):
         """Show contract information popup"""
         info_text = f"""
 Name: {self.contract.get('name', 'Unknown')}
 Address: {self.contract.get('address', 'Unknown')}
-Chain: {self.contract.get('chain', 'Unknown').title()}
+Chain: {_CHAIN_DISPLAY.get(self.contract.get('chain', ''), 'Unknown')}
 Type: {self.contract.get('type', 'Unknown')}
 Verified: {'Yes' if self.contract.get('verified') else 'No'}
 Compiler: {self.contract.get('compiler_version', 'Unknown')}
@@ -133,30 +167,64 @@ Compiler: {self.contract.get('compiler_version', 'Unknown')}
         
         self.show_popup(info_text, title="Contract Information")
     
+    def _show_popup_later(self, message, dt):
+        """Clock callback target for popups posted from worker threads"""
+        self.show_popup(message)
+    
     def show_popup(self, message, title="Info"):
-        """Show popup message"""
-        popup = Popup(
-            title=title,
-            content=Label(text=message),
-            size_hint=(0.8, 0.6)
-        )
-        popup.open()
+        """Show a message in the app's shared popup"""
+        self.app.show_popup(message, title)
 
 
 class Web3LOCMobileApp(BoxLayout):
     """Main mobile app interface"""
     
-    def __init__(self, **kwargs):
+    def __init__(self, loop, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.spacing = '10dp'
         self.padding = '10dp'
         
+        self.loop = loop
         self.storage = GitHubStorage()
         self.contracts = []
-        
+
+        # Prefetch bookkeeping: contracts whose payloads are already warmed
+        self._prefetched = set()
+        self._prefetch_sem = None
+
+        # One popup reused for every message: opening becomes two attribute
+        # writes plus open() instead of building a widget tree per tap
+        self._popup = Popup(
+            title='',
+            content=Label(text=''),
+            size_hint=(0.8, 0.6)
+        )
+
+        # Open the shared HTTP session up front so the first user action
+        # doesn't pay session/connection setup
+        asyncio.run_coroutine_threadsafe(self.storage.initialize(), self.loop)
+
         self.build_interface()
     
+    def run_async(self, coro, on_done):
+        """Dispatch a coroutine to the background loop.
+        
+        The done callback receives the finished future and is scheduled on
+        the Kivy UI thread.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(partial(self._dispatch_done, on_done))
+    
+    def _dispatch_done(self, on_done, future):
+        """Hop a finished future's callback onto the UI thread"""
+        Clock.schedule_once(partial(self._invoke_done, on_done, future), 0)
+    
+    @staticmethod
+    def _invoke_done(on_done, future, dt):
+        """Clock callback target delivering the future to its handler"""
+        on_done(future)
+    
     def build_interface(self):
         """Build the mobile interface"""
         
@@ -217,156 +285,206 @@ class Web3LOCMobileApp(BoxLayout):
         )
         self.add_widget(self.status_label)
         
-        # Contracts list
-        self.scroll = ScrollView()
-        self.contracts_layout = BoxLayout(orientation='vertical', size_hint_y=None)
-        self.contracts_layout.bind(minimum_height=self.contracts_layout.setter('height'))
+        # Contracts list: RecycleView keeps only the visible cards alive
+        self.rv = RecycleView()
+        self.rv.viewclass = ContractCard
+        
+        contracts_layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, dp(150)),
+            default_size_hint=(1, None),
+            spacing='5dp'
+        )
+        contracts_layout.bind(minimum_height=contracts_layout.setter('height'))
+        self.rv.add_widget(contracts_layout)
+        self.rv.bind(scroll_y=self._on_scroll)
         
-        self.scroll.add_widget(self.contracts_layout)
-        self.add_widget(self.scroll)
+        self.add_widget(self.rv)
         
         # Load initial data
-        Clock.schedule_once(lambda dt: self.refresh_data(None), 1)
+        Clock.schedule_once(self._initial_refresh, 1)
     
+    def _initial_refresh(self, dt):
+        """Kick off the first data load once the UI is up"""
+        self.refresh_data(None)
+    
+    def _on_scroll(self, instance, value):
+        """Prefetch export payloads for contracts near the viewport"""
+        total = len(self.contracts)
+        if not total:
+            return
+
+        # Map scroll position (1.0 = top) to a contract index window
+        top_index = int((1.0 - value) * total)
+        start = max(0, top_index - 2)
+        end = min(total, top_index + 6)
+
+        for contract in self.contracts[start:end]:
+            self._queue_prefetch(contract)
+
+    def _queue_prefetch(self, contract):
+        """Schedule a one-time background prefetch for a contract"""
+        key = (contract.get('chain'), contract.get('address'))
+        if not all(key) or key in self._prefetched:
+            return
+
+        self._prefetched.add(key)
+        asyncio.run_coroutine_threadsafe(self._prefetch(contract), self.loop)
+
+    async def _prefetch(self, contract):
+        """Warm the response cache with a contract's .sol and README payloads"""
+        if self._prefetch_sem is None:
+            self._prefetch_sem = asyncio.Semaphore(4)
+
+        async with self._prefetch_sem:
+            try:
+                await self.storage.export_contract_sol(contract['address'], contract['chain'])
+                await self.storage.export_contract_readme(contract['address'], contract['chain'])
+            except Exception as error:
+                # Prefetching is speculative; the tap path will retry
+                logging.debug(f"Prefetch failed for {contract.get('address')}: {error}")
+
     def search_contracts(self, instance):
         """Search for contracts"""
-        def run_search():
-            try:
-                self.update_status("Searching...")
-                
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                # Build search filters
-                filters = {'limit': 20}
-                
-                search_term = self.search_input.text.strip()
-                if search_term:
-                    filters['name_filter'] = search_term
-                
-                chain = self.chain_spinner.text.lower()
-                if chain != 'all chains':
-                    filters['chain'] = chain
-                
-                # Search contracts
-                contracts = loop.run_until_complete(
-                    self.storage.search_contracts(filters)
-                )
-                
-                self.contracts = contracts
-                Clock.schedule_once(lambda dt: self.update_contracts_display(), 0)
-                Clock.schedule_once(lambda dt: self.update_status(f"Found {len(contracts)} contracts"), 0)
-                
-            except Exception as e:
-                Clock.schedule_once(lambda dt: self.update_status(f"Search error: {str(e)}"), 0)
-        
-        threading.Thread(target=run_search).start()
+        self.update_status("Searching...")
+        
+        # Build search filters
+        filters = {'limit': 20}
+        
+        search_term = self.search_input.text.strip()
+        if search_term:
+            filters['name_filter'] = search_term
+        
+        chain = _CHAIN_CANON.get(self.chain_spinner.text, 'all')
+        if chain != 'all':
+            filters['chain'] = chain
+        
+        self.run_async(self.storage.search_contracts(filters), self._on_search_done)
+    
+    def _on_search_done(self, future):
+        """Apply search results on the UI thread"""
+        try:
+            contracts = future.result()
+            self.contracts = contracts
+            self.update_contracts_display()
+            self.update_status(f"Found {len(contracts)} contracts")
+        except Exception as e:
+            self.update_status(f"Search error: {str(e)}")
     
     def refresh_data(self, instance):
         """Refresh contract data"""
-        def run_refresh():
-            try:
-                self.update_status("Loading recent contracts...")
-                
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                # Get recent contracts
-                contracts = loop.run_until_complete(
-                    self.storage.get_recent_contracts(15)
-                )
-                
-                self.contracts = contracts
-                Clock.schedule_once(lambda dt: self.update_contracts_display(), 0)
-                Clock.schedule_once(lambda dt: self.update_status(f"Loaded {len(contracts)} recent contracts"), 0)
-                
-            except Exception as e:
-                Clock.schedule_once(lambda dt: self.update_status(f"Load error: {str(e)}"), 0)
-        
-        threading.Thread(target=run_refresh).start()
+        self.update_status("Loading recent contracts...")
+        self.run_async(self.storage.get_recent_contracts(15), self._on_refresh_done)
+    
+    def _on_refresh_done(self, future):
+        """Apply refreshed contract data on the UI thread"""
+        try:
+            contracts = future.result()
+            self.contracts = contracts
+            self.update_contracts_display()
+            self.update_status(f"Loaded {len(contracts)} recent contracts")
+        except Exception as e:
+            self.update_status(f"Load error: {str(e)}")
     
     def export_csv(self, instance):
         """Export contracts as CSV"""
-        def run_export():
-            try:
-                self.update_status("Exporting CSV...")
-                
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                # Export current contracts as CSV
-                filters = {'limit': len(self.contracts)} if self.contracts else {'limit': 50}
-                csv_content = loop.run_until_complete(
-                    self.storage.export_contracts_csv(filters)
-                )
-                
-                filename = f"web3loc_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                self.storage.save_file(csv_content, filename, './downloads/')
-                
-                Clock.schedule_once(lambda dt: self.update_status(f"Exported: {filename}"), 0)
-                Clock.schedule_once(lambda dt: self.show_popup(f"CSV exported successfully!\nFile: {filename}"), 0)
-                
-            except Exception as e:
-                Clock.schedule_once(lambda dt: self.update_status(f"Export error: {str(e)}"), 0)
-        
-        threading.Thread(target=run_export).start()
+        self.update_status("Exporting CSV...")
+        
+        filters = {'limit': len(self.contracts)} if self.contracts else {'limit': 50}
+        filename = f"web3loc_export_{datetime.now():%Y%m%d_%H%M%S}.csv"
+
+        self.run_async(
+            self.storage.export_contracts_csv_to_file(filters, f"./downloads/{filename}"),
+            partial(self._on_export_done, filename=filename)
+        )
+
+    def _on_export_done(self, future, filename):
+        """Report the finished CSV export on the UI thread"""
+        try:
+            future.result()
+            self.update_status(f"Exported: {filename}")
+            self.show_popup(f"CSV exported successfully!\nFile: {filename}")
+        except Exception as e:
+            self.update_status(f"Export error: {str(e)}")
     
     def show_stats(self, instance):
         """Show contract statistics"""
-        def run_stats():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                stats = loop.run_until_complete(
-                    self.storage.get_contract_statistics()
-                )
-                
-                stats_text = f"""
+        self.run_async(self.storage.get_contract_statistics(), self._on_stats_done)
+    
+    def _on_stats_done(self, future):
+        """Show the statistics popup on the UI thread"""
+        try:
+            stats = future.result()
+            
+            stats_text = f"""
 Total Contracts: {stats.get('total_contracts', 0)}
 Ethereum: {stats.get('chains', {}).get('ethereum', 0)}
 Base: {stats.get('chains', {}).get('base', 0)}
 Last Updated: {stats.get('last_updated', 'Unknown')[:19] if stats.get('last_updated') else 'Unknown'}
-                """
-                
-                Clock.schedule_once(lambda dt: self.show_popup(stats_text, "Repository Statistics"), 0)
-                
-            except Exception as e:
-                Clock.schedule_once(lambda dt: self.show_popup(f"Error loading stats: {str(e)}"), 0)
-        
-        threading.Thread(target=run_stats).start()
+            """
+            
+            self.show_popup(stats_text, "Repository Statistics")
+        except Exception as e:
+            self.show_popup(f"Error loading stats: {str(e)}")
     
     def update_contracts_display(self):
         """Update the contracts display"""
-        self.contracts_layout.clear_widgets()
-        
+        # Render the label texts once per contract here; refresh_view_attrs
+        # then rebinds recycled cards with plain attribute reads, keeping
+        # string slicing and formatting off the scroll path
         for contract in self.contracts:
-            card = ContractCard(contract, self.storage)
-            self.contracts_layout.add_widget(card)
+            if '_display_name' not in contract:
+                contract['_display_name'] = f"[b]{contract.get('name', 'Unknown')}[/b]"
+                contract['_display_addr'] = f"Address: {contract.get('address', '')[:20]}..."
+                contract['_display_chain'] = f"Chain: {_CHAIN_DISPLAY.get(contract.get('chain', ''), 'Unknown')}"
+
+        self.rv.data = [
+            {'contract': contract, 'storage': self.storage, 'loop': self.loop, 'app': self}
+            for contract in self.contracts
+        ]
         
         if not self.contracts:
-            no_contracts = Label(text='No contracts found')
-            self.contracts_layout.add_widget(no_contracts)
+            self.update_status('No contracts found')
+        else:
+            # Warm the cache for whatever is initially visible
+            self._on_scroll(self.rv, self.rv.scroll_y)
     
     def update_status(self, message):
-        """Update status message"""
-        Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', message), 0)
+        """Update status message.
+
+        Must be called from the UI thread. Button handlers run there already
+        and run_async delivers done callbacks there, so the display update and
+        status text land in the same frame without extra clock posts.
+        """
+        self.status_label.text = message
     
     def show_popup(self, message, title="Info"):
-        """Show popup message"""
-        popup = Popup(
-            title=title,
-            content=Label(text=message),
-            size_hint=(0.8, 0.6)
-        )
-        popup.open()
+        """Show popup message via the shared, reusable popup"""
+        self._popup.title = title
+        self._popup.content.text = message
+        self._popup.open()
 
 
 class Web3LOCApp(App):
     """Main Kivy App"""
     
     def build(self):
-        return Web3LOCMobileApp()
+        # One long-lived asyncio loop in a background thread; all network
+        # work is dispatched to it so aiohttp connections get reused
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        
+        self.interface = Web3LOCMobileApp(loop=self.loop)
+        return self.interface
+    
+    def on_stop(self):
+        """Shut down the background loop, IO pool and HTTP session"""
+        asyncio.run_coroutine_threadsafe(
+            self.interface.storage.close(), self.loop
+        ).result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        _IO_POOL.shutdown(wait=False)
 
 
 if __name__ == '__main__':
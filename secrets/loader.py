@@ -3,18 +3,64 @@ Secure environment variable loader for Web3.LOC project.
 Handles API keys and sensitive configuration data.
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
+# Service name -> environment variable, built once at import time
+_KEY_MAPPING = {
+    'etherscan': 'ETHERSCAN_API_KEY',
+    'bscscan': 'BSC_API_KEY',
+    'polygonscan': 'POLYGON_API_KEY',
+    'arbiscan': 'ARBITRUM_API_KEY',
+    'optimism': 'OPTIMISM_API_KEY',
+    'snowtrace': 'AVALANCHE_API_KEY',
+    'ftmscan': 'FANTOM_API_KEY',
+    'github': 'GITHUB_TOKEN'
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _get_api_key(service: str) -> Optional[str]:
+    """Resolve and cache the API key for a service."""
+    env_var = _KEY_MAPPING.get(service)
+    if not env_var:
+        raise ValueError(f"Unknown service: {service}")
+
+    key = os.getenv(env_var)
+    if not key or key.startswith('your_'):
+        print(f"Warning: {env_var} not set or using placeholder value")
+        return None
+
+    return key
+
+
+@functools.lru_cache(maxsize=None)
+def _get_int_config(env_var: str, default: int) -> int:
+    """Resolve and cache an integer configuration value."""
+    return int(os.getenv(env_var, default))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_contracts_dir() -> Path:
+    """Resolve and cache the contracts output directory."""
+    return Path(os.getenv('CONTRACTS_DIR', './contracts_library'))
+
+
 class SecretsLoader:
-    """Centralized secrets and configuration management."""
-    
+    """Centralized secrets and configuration management.
+
+    Lookups are cached after the first call; environment variables are
+    stable for the life of the process. Call reload() after changing the
+    environment (e.g. in tests) to drop the caches.
+    """
+
     def __init__(self):
         """Initialize the secrets loader."""
         self._load_environment()
-        
+
     def _load_environment(self):
         """Load environment variables from .env file."""
         env_path = Path(__file__).parent.parent / '.env'
@@ -23,59 +69,45 @@ class SecretsLoader:
         else:
             print(f"Warning: .env file not found at {env_path}")
             print("Please copy .env.example to .env and fill in your API keys")
-    
+
     def get_api_key(self, service: str) -> Optional[str]:
         """Get API key for a specific service."""
-        key_mapping = {
-            'etherscan': 'ETHERSCAN_API_KEY',
-            'bscscan': 'BSC_API_KEY',
-            'polygonscan': 'POLYGON_API_KEY',
-            'arbiscan': 'ARBITRUM_API_KEY',
-            'optimism': 'OPTIMISM_API_KEY',
-            'snowtrace': 'AVALANCHE_API_KEY',
-            'ftmscan': 'FANTOM_API_KEY',
-            'github': 'GITHUB_TOKEN'
-        }
-        
-        env_var = key_mapping.get(service.lower())
-        if not env_var:
-            raise ValueError(f"Unknown service: {service}")
-            
-        key = os.getenv(env_var)
-        if not key or key.startswith('your_'):
-            print(f"Warning: {env_var} not set or using placeholder value")
-            return None
-            
-        return key
-    
+        return _get_api_key(service.lower())
+
     def get_config(self, key: str, default=None):
         """Get configuration value."""
         return os.getenv(key, default)
-    
+
     def get_rate_limit(self) -> int:
         """Get rate limit for API calls."""
-        return int(os.getenv('RATE_LIMIT', 5))
-    
+        return _get_int_config('RATE_LIMIT', 5)
+
     def get_contracts_dir(self) -> Path:
         """Get contracts output directory."""
-        contracts_dir = os.getenv('CONTRACTS_DIR', './contracts_library')
-        return Path(contracts_dir)
-    
+        return _get_contracts_dir()
+
     def get_min_contract_age_days(self) -> int:
         """Get minimum contract age in days."""
-        return int(os.getenv('MIN_CONTRACT_AGE_DAYS', 30))
-    
+        return _get_int_config('MIN_CONTRACT_AGE_DAYS', 30)
+
     def get_max_contracts_per_run(self) -> int:
         """Get maximum contracts to process per run."""
-        return int(os.getenv('MAX_CONTRACTS_PER_RUN', 1000))
-    
+        return _get_int_config('MAX_CONTRACTS_PER_RUN', 1000)
+
     def get_github_rate_limit(self) -> int:
         """Get GitHub API rate limit (80% of max)."""
-        return int(os.getenv('GITHUB_RATE_LIMIT', 4000))
-    
+        return _get_int_config('GITHUB_RATE_LIMIT', 4000)
+
     def get_github_token(self) -> Optional[str]:
         """Get GitHub personal access token."""
         return self.get_api_key('github')
 
+    def reload(self):
+        """Re-read the environment, dropping all cached lookups."""
+        _get_api_key.cache_clear()
+        _get_int_config.cache_clear()
+        _get_contracts_dir.cache_clear()
+        self._load_environment()
+
 # Global instance
-secrets = SecretsLoader()
\ No newline at end of file
+secrets = SecretsLoader()
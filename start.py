@@ -4,6 +4,7 @@ Web3.LOC Startup Script - Launch the complete contract discovery platform
 This script provides an easy way to start the Web3.LOC system with all components.
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -31,15 +32,19 @@ def check_env_file():
         print("")
         return False
     
-    # Check for required keys
+    # Check for required keys with a single parse of the file; dotenv
+    # also handles comments and quoted values correctly, unlike the
+    # substring scan. Import lazily — this script is the bootstrapper,
+    # so dotenv may not be installed until install_dependencies() runs.
     required_keys = ['ETHERSCAN_API_KEY', 'BASESCAN_API_KEY']
-    env_content = env_path.read_text()
-    
-    missing_keys = []
-    for key in required_keys:
-        if key not in env_content or f"{key}=" not in env_content:
-            missing_keys.append(key)
-    
+    try:
+        from dotenv import dotenv_values
+        values = dotenv_values(env_path)
+        missing_keys = [key for key in required_keys if not values.get(key)]
+    except ImportError:
+        env_content = env_path.read_text()
+        missing_keys = [key for key in required_keys if key not in env_content]
+
     if missing_keys:
         print(f"❌ Error: Missing required environment variables: {', '.join(missing_keys)}")
         return False
@@ -50,8 +55,20 @@ def check_env_file():
 def install_dependencies():
     """Install required dependencies."""
     print("📦 Installing dependencies...")
+
+    # Run pip in-process when possible: skips a full interpreter cold
+    # start just to reach pip's entry point. The import is private API,
+    # so fall back to the subprocess on any pip version that moved it.
+    try:
+        from pip._internal.cli.main import main as pip_main
+        if pip_main(['install', '-r', 'requirements.txt']) == 0:
+            print("✅ Dependencies installed successfully")
+            return True
+    except Exception:
+        pass
+
     try:
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], 
+        subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'],
                       check=True, capture_output=True, text=True)
         print("✅ Dependencies installed successfully")
         return True
@@ -64,7 +81,11 @@ def create_directories():
     """Create necessary directories."""
     directories = ['./exports', './contract_readmes', './logs']
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        path = Path(directory)
+        # A stat is cheaper than re-walking the mkdir syscall path on
+        # every launch once the directories exist
+        if not path.exists():
+            path.mkdir(parents=True)
     print("✅ Directories created")
 
 def launch_web_interface():
@@ -113,13 +134,12 @@ def main():
     if not check_env_file():
         sys.exit(1)
     
-    # Install dependencies if needed
-    try:
-        import streamlit
-        import plotly
-        import aiohttp
+    # Install dependencies if needed. find_spec only consults package
+    # metadata, so availability is checked without executing each
+    # package's full import tree just to answer yes/no.
+    if all(importlib.util.find_spec(m) for m in ('streamlit', 'plotly', 'aiohttp')):
         print("✅ Core dependencies available")
-    except ImportError:
+    else:
         if not install_dependencies():
             sys.exit(1)
     
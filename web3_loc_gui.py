@@ -8,10 +8,20 @@ import pandas as pd
 import plotly.express as px
 import asyncio
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any
 import os
 
+# Optional: uvloop replaces the selector event loop with libuv, cutting
+# syscall overhead for the async API calls; every loop created below
+# (including the cached persistent ones) picks the policy up
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Import our modules
 from contract_discovery.enhanced_blockchain_client import BlockchainClientManager
 from contract_discovery.contract_database import ContractDatabase, ContractAnalyzer
@@ -30,7 +40,10 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+@st.cache_resource
+def _page_css() -> str:
+    """Static page CSS, built once per process and reused on reruns."""
+    return """
 <style>
     .main-header {
         font-size: 3rem;
@@ -77,7 +90,149 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_page_css(), unsafe_allow_html=True)
+
+# Columns the analytics page actually renders; projecting just these
+# keeps multi-KB source_code/bytecode/abi fields out of every fetch
+_ANALYTICS_COLUMNS = (
+    'name', 'address', 'chain', 'compiler_version',
+    'optimization', 'runs', 'contract_summary'
+)
+
+@st.cache_resource(show_spinner=False)
+def get_client_manager():
+    """Get a persistent event loop and initialized blockchain client manager.
+
+    Building the manager per button click paid TLS handshake and
+    connection-pool warmup on every action; st.cache_resource keeps the
+    aiohttp session and its pooled connections alive across reruns.
+    Streamlit has no eviction callback for cached resources, so the loop
+    and session simply live for the process lifetime.
+    """
+    loop = asyncio.new_event_loop()
+    manager = BlockchainClientManager()
+    loop.run_until_complete(manager.initialize())
+    return loop, manager
+
+@st.cache_resource(show_spinner=False)
+def get_github_storage():
+    """Get a persistent event loop and initialized GitHub storage manager."""
+    loop = asyncio.new_event_loop()
+    storage = GitHubStorageManager()
+    loop.run_until_complete(storage.initialize())
+    return loop, storage
+
+def _db_cache_key(db_path: str) -> float:
+    """Get a cache key that tracks database writes under WAL.
+
+    With journal_mode=WAL, committed writes land in the -wal file while a
+    connection is open and the main database file's mtime does not move,
+    so key on the newest mtime of the two.
+    """
+    key = os.path.getmtime(db_path)
+    wal_path = db_path + '-wal'
+    if os.path.exists(wal_path):
+        key = max(key, os.path.getmtime(wal_path))
+    return key
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _cached_stats(db_path_mtime: float) -> Dict[str, Any]:
+    """Get database statistics, cached per database-file mtime.
+
+    Streamlit reruns the whole script on every widget interaction, so an
+    uncached call repeats the aggregation SQL on each rerun. Keying the
+    cache on the SQLite file's mtime invalidates it as soon as new
+    contracts are written.
+    """
+    return ContractDatabase().get_statistics()
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _cached_contracts(db_path_mtime: float,
+                      chain: Any = None,
+                      optimization: Any = None,
+                      compiler: Any = None) -> pd.DataFrame:
+    """Fetch contracts with the filters pushed down into SQL.
+
+    The filter values are part of the cache key, so toggling a filter
+    back to a previous combination is a cache hit instead of a re-fetch,
+    and only the matching rows are ever materialized.
+    """
+    contracts = ContractDatabase().get_contracts_filtered(
+        chain=chain,
+        optimization=optimization,
+        compiler=compiler,
+        columns=list(_ANALYTICS_COLUMNS)
+    )
+    return pd.DataFrame(contracts)
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _cached_filter_options(db_path_mtime: float) -> Dict[str, List[str]]:
+    """Get distinct filter dropdown values without loading full rows."""
+    return ContractDatabase().get_filter_options()
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _cached_remote_search(chain, name_filter, address_filter, limit) -> List[Dict[str, Any]]:
+    """Search the remote repository, cached per filter combination.
+
+    Repeating an identical search within the TTL is served from memory
+    instead of another round of GitHub API calls.
+    """
+    loop, storage = get_github_storage()
+    return loop.run_until_complete(storage.search_contracts(
+        chain=chain,
+        name_filter=name_filter,
+        address_filter=address_filter,
+        limit=limit
+    ))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_repo_stats() -> Dict[str, Any]:
+    """Get remote repository statistics, cached briefly.
+
+    The statistics expander re-renders on every rerun; without this
+    each render was a fresh HTTPS round-trip to GitHub.
+    """
+    loop, storage = get_github_storage()
+    return loop.run_until_complete(storage.get_contract_statistics())
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _chain_pie_chart(chain_data: tuple):
+    """Build the contracts-by-chain pie, cached on the (name, count) data.
+
+    st.plotly_chart serializes the figure JSON on every call; caching the
+    figure object skips rebuilding it when the counts have not changed.
+    """
+    names, values = zip(*chain_data)
+    return px.pie(
+        values=list(values),
+        names=list(names),
+        title="Distribution of Contracts by Blockchain"
+    )
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _compiler_bar_chart(compiler_data: tuple):
+    """Build the top-compilers bar chart, cached on the (name, count) data."""
+    names, values = zip(*compiler_data)
+    fig = px.bar(
+        x=list(values),
+        y=list(names),
+        orientation='h',
+        title="Most Used Solidity Compilers"
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _optimization_pie_chart(opt_counts: tuple):
+    """Build the optimization-distribution pie, cached on the counts."""
+    flags, values = zip(*opt_counts)
+    return px.pie(
+        values=list(values),
+        names=['Optimized' if flag else 'Not Optimized' for flag in flags],
+        title="Optimization Distribution"
+    )
 
 class Web3LOCApp:
     """Main application class for Web3.LOC interface."""
@@ -86,8 +241,7 @@ class Web3LOCApp:
         """Initialize the application."""
         self.db = ContractDatabase()
         self.client_manager = None
-        self.github_storage = GitHubStorageManager()
-        
+
     def run(self):
         """Run the main application."""
         st.markdown('<h1 class="main-header">🔍 Web3.LOC</h1>', unsafe_allow_html=True)
@@ -117,7 +271,7 @@ class Web3LOCApp:
         st.header("📊 Dashboard")
         
         # Get database statistics
-        stats = self.db.get_statistics()
+        stats = _cached_stats(_db_cache_key(self.db.db_path))
         
         if not stats:
             st.warning("No contract data available. Use the Discovery page to scan for contracts.")
@@ -165,37 +319,35 @@ class Web3LOCApp:
         with col1:
             st.subheader("Contracts by Chain")
             if stats.get('by_chain'):
-                chain_data = stats['by_chain']
-                fig = px.pie(
-                    values=list(chain_data.values()),
-                    names=list(chain_data.keys()),
-                    title="Distribution of Contracts by Blockchain"
-                )
+                fig = _chain_pie_chart(tuple(stats['by_chain'].items()))
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("Top Compiler Versions")
             if stats.get('top_compilers'):
-                compiler_data = stats['top_compilers']
-                fig = px.bar(
-                    x=list(compiler_data.values()),
-                    y=list(compiler_data.keys()),
-                    orientation='h',
-                    title="Most Used Solidity Compilers"
-                )
-                fig.update_layout(yaxis={'categoryorder':'total ascending'})
+                fig = _compiler_bar_chart(tuple(stats['top_compilers'].items()))
                 st.plotly_chart(fig, use_container_width=True)
         
         # Recent contracts
         st.subheader("Recent Contracts")
-        recent_contracts = self.db.get_contracts(limit=10)
+        recent_contracts = self.db.get_contracts(
+            limit=10,
+            columns=['name', 'chain', 'address', 'compiler_version', 'verified_date']
+        )
         
         if recent_contracts:
             df = pd.DataFrame(recent_contracts)
             display_columns = ['name', 'chain', 'address', 'compiler_version', 'verified_date']
-            df_display = df[display_columns].copy()
-            df_display['address'] = df_display['address'].apply(lambda x: f"{x[:10]}...{x[-8:]}" if isinstance(x, str) else str(x))
-            df_display['verified_date'] = pd.to_datetime(df_display['verified_date']).dt.strftime('%Y-%m-%d %H:%M')
+            df_display = df[display_columns].head(10).copy()
+            # Vectorized string slicing runs in C over the whole column,
+            # versus per-row Python lambda dispatch with .apply
+            addresses = df_display['address'].astype(str)
+            df_display['address'] = addresses.str.slice(0, 10) + '...' + addresses.str.slice(-8)
+            # verified_date is stored as datetime.now().isoformat(), so
+            # reformatting is pure string slicing — no need to run the
+            # datetime parser just to print YYYY-MM-DD HH:MM
+            dates = df_display['verified_date'].astype(str)
+            df_display['verified_date'] = dates.str.slice(0, 10) + ' ' + dates.str.slice(11, 16)
             
             st.dataframe(df_display, use_container_width=True)
         else:
@@ -267,55 +419,62 @@ class Web3LOCApp:
     def show_analytics(self):
         """Show analytics and insights about discovered contracts."""
         st.header("📊 Contract Analytics")
-        
-        # Get all contracts for analysis
-        contracts = self.db.get_contracts()
-        
-        if not contracts:
+
+        db_mtime = _db_cache_key(self.db.db_path)
+        stats = _cached_stats(db_mtime)
+
+        if not stats.get('total_contracts'):
             st.warning("No contract data available for analysis.")
             return
-        
-        df = pd.DataFrame(contracts)
-        
-        # Filter controls
+
+        self._analytics_filtered_block()
+
+    @st.fragment
+    def _analytics_filtered_block(self) -> None:
+        """Render the filter widgets, charts and table as a fragment.
+
+        Interacting with the selectboxes reruns only this block rather
+        than the whole page, so the header and dashboard-level work
+        outside it are untouched per filter change.
+        """
+        db_mtime = _db_cache_key(self.db.db_path)
+
+        # Filter controls; read the widgets first so their values become
+        # part of the cache key for the contract fetch below
         st.subheader("Filters")
+        options = _cached_filter_options(db_mtime)
         col1, col2, col3 = st.columns(3)
-        
+
         with col1:
             chain_filter = st.selectbox(
                 "Chain",
-                options=["All"] + list(df['chain'].unique()),
+                options=["All"] + options['chains'],
                 index=0
             )
-        
+
         with col2:
             optimization_filter = st.selectbox(
                 "Optimization",
                 options=["All", "Optimized", "Not Optimized"],
                 index=0
             )
-        
+
         with col3:
             compiler_filter = st.selectbox(
                 "Compiler Version",
-                options=["All"] + list(df['compiler_version'].unique()),
+                options=["All"] + options['compilers'],
                 index=0
             )
-        
-        # Apply filters
-        filtered_df = df.copy()
-        
-        if chain_filter != "All":
-            filtered_df = filtered_df[filtered_df['chain'] == chain_filter]
-        
-        if optimization_filter == "Optimized":
-            filtered_df = filtered_df[filtered_df['optimization'] == True]
-        elif optimization_filter == "Not Optimized":
-            filtered_df = filtered_df[filtered_df['optimization'] == False]
-        
-        if compiler_filter != "All":
-            filtered_df = filtered_df[filtered_df['compiler_version'] == compiler_filter]
-        
+
+        # Push the filters down into SQL instead of masking a full
+        # in-memory DataFrame; only matching rows are materialized
+        filtered_df = _cached_contracts(
+            db_mtime,
+            chain=None if chain_filter == "All" else chain_filter,
+            optimization={"Optimized": True, "Not Optimized": False}.get(optimization_filter),
+            compiler=None if compiler_filter == "All" else compiler_filter
+        )
+
         # Display filtered results
         st.subheader(f"Analysis Results ({len(filtered_df)} contracts)")
         
@@ -326,11 +485,7 @@ class Web3LOCApp:
             with col1:
                 # Optimization distribution
                 opt_counts = filtered_df['optimization'].value_counts()
-                fig = px.pie(
-                    values=opt_counts.values,
-                    names=['Optimized' if x else 'Not Optimized' for x in opt_counts.index],
-                    title="Optimization Distribution"
-                )
+                fig = _optimization_pie_chart(tuple(opt_counts.items()))
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
@@ -360,8 +515,22 @@ class Web3LOCApp:
         # Display table
         display_columns = ['name', 'address', 'chain', 'compiler_version', 'optimization', 'runs', 'contract_summary']
         if len(filtered_df) > 0:
+            # Every rendered row is serialized over the Streamlit
+            # websocket to the browser; cap the payload and page through
+            # large result sets instead of shipping the whole table
+            max_rows = 2000
+            start = 0
+            if len(filtered_df) > max_rows:
+                start = st.slider(
+                    "Start row",
+                    min_value=0,
+                    max_value=len(filtered_df) - 1,
+                    value=0,
+                    step=max_rows,
+                    help=f"Showing {max_rows} rows per page"
+                )
             st.dataframe(
-                filtered_df[display_columns],
+                filtered_df[display_columns].iloc[start:start + max_rows],
                 use_container_width=True,
                 hide_index=True
             )
@@ -422,7 +591,7 @@ class Web3LOCApp:
         with tab2:
             st.subheader("Search Remote Repository")
             
-            if not self.github_storage.is_available():
+            if not self._github_configured():
                 st.warning("⚠️ GitHub storage not configured. Please set GITHUB_TOKEN environment variable.")
                 return
             
@@ -455,21 +624,35 @@ class Web3LOCApp:
             if st.button("🔍 Search Remote Repository", key="search_remote"):
                 with st.spinner("Searching remote repository..."):
                     try:
-                        # Initialize GitHub storage if needed
-                        if not hasattr(self.github_storage, 'session') or not self.github_storage.session:
-                            asyncio.run(self.github_storage.initialize())
-                        
-                        # Search parameters
-                        search_params = {
-                            'chain': None if chain_filter == "All" else chain_filter,
-                            'name_filter': name_filter if name_filter else None,
-                            'address_filter': address_filter if address_filter else None,
-                            'limit': limit
-                        }
-                        
-                        # Perform async search
-                        remote_results = asyncio.run(self.github_storage.search_contracts(**search_params))
+                        loop, storage = get_github_storage()
+
+                        # Cached per filter combination; identical repeat
+                        # searches skip the GitHub round-trips entirely
+                        remote_results = _cached_remote_search(
+                            None if chain_filter == "All" else chain_filter,
+                            name_filter if name_filter else None,
+                            address_filter if address_filter else None,
+                            limit
+                        )
                         
+                        # Prefetch the first few full contract blobs in one
+                        # concurrent batch so Load Full Details answers from
+                        # memory instead of a fresh GitHub round-trip
+                        prefetch = st.session_state.setdefault('remote_prefetch', {})
+                        to_fetch = [
+                            c for c in remote_results[:10]
+                            if c['contract_id'] not in prefetch
+                        ]
+                        if to_fetch:
+                            details = loop.run_until_complete(asyncio.gather(
+                                *(storage.get_contract(c['contract_id'], c['chain'])
+                                  for c in to_fetch),
+                                return_exceptions=True
+                            ))
+                            for entry, detail in zip(to_fetch, details):
+                                if detail and not isinstance(detail, BaseException):
+                                    prefetch[entry['contract_id']] = detail
+
                         st.subheader(f"Remote Results ({len(remote_results)} found)")
                         
                         if remote_results:
@@ -491,12 +674,16 @@ class Web3LOCApp:
                                     # Button to load full contract details
                                     if st.button(f"Load Full Details", key=f"load_{contract['contract_id']}"):
                                         with st.spinner("Loading contract details..."):
-                                            full_contract = asyncio.run(
-                                                self.github_storage.get_contract(
-                                                    contract['contract_id'], 
-                                                    contract['chain']
+                                            # Served from the prefetch batch
+                                            # when available
+                                            full_contract = prefetch.get(contract['contract_id'])
+                                            if full_contract is None:
+                                                full_contract = loop.run_until_complete(
+                                                    storage.get_contract(
+                                                        contract['contract_id'],
+                                                        contract['chain']
+                                                    )
                                                 )
-                                            )
                                             
                                             if full_contract:
                                                 st.success("✅ Contract details loaded!")
@@ -524,27 +711,7 @@ class Web3LOCApp:
             # Show repository statistics
             with st.expander("📊 Repository Statistics"):
                 try:
-                    if not hasattr(self.github_storage, 'session') or not self.github_storage.session:
-                        asyncio.run(self.github_storage.initialize())
-                    
-                    stats = asyncio.run(self.github_storage.get_contract_statistics())
-                    
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric("Total Contracts", stats.get('total_contracts', 0))
-                    
-                    with col2:
-                        ethereum_count = stats.get('chains', {}).get('ethereum', 0)
-                        st.metric("Ethereum Contracts", ethereum_count)
-                    
-                    with col3:
-                        base_count = stats.get('chains', {}).get('base', 0)
-                        st.metric("Base Contracts", base_count)
-                    
-                    if stats.get('last_updated'):
-                        st.write(f"**Last Updated:** {stats['last_updated'][:19].replace('T', ' ')}")
-                        
+                    self._render_repo_stats()
                 except Exception as e:
                     st.error(f"Error loading repository statistics: {str(e)}")
                     logger.error(f"Stats error: {str(e)}")
@@ -556,7 +723,7 @@ class Web3LOCApp:
         # GitHub Configuration
         st.subheader("☁️ GitHub Storage Configuration")
         
-        github_available = self.github_storage.is_available()
+        github_available = self._github_configured()
         
         if github_available:
             st.success("✅ GitHub storage is configured and available")
@@ -569,10 +736,8 @@ class Web3LOCApp:
             if st.button("🧪 Test GitHub Connection"):
                 with st.spinner("Testing GitHub connection..."):
                     try:
-                        if not hasattr(self.github_storage, 'session') or not self.github_storage.session:
-                            asyncio.run(self.github_storage.initialize())
-                        
-                        stats = asyncio.run(self.github_storage.get_contract_statistics())
+                        loop, storage = get_github_storage()
+                        stats = loop.run_until_complete(storage.get_contract_statistics())
                         st.success(f"✅ Connection successful! Found {stats.get('total_contracts', 0)} contracts in repository.")
                     except Exception as e:
                         st.error(f"❌ Connection failed: {str(e)}")
@@ -580,27 +745,7 @@ class Web3LOCApp:
             # Repository statistics
             with st.expander("📊 Repository Statistics"):
                 try:
-                    if not hasattr(self.github_storage, 'session') or not self.github_storage.session:
-                        asyncio.run(self.github_storage.initialize())
-                    
-                    stats = asyncio.run(self.github_storage.get_contract_statistics())
-                    
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric("Total Contracts", stats.get('total_contracts', 0))
-                    
-                    with col2:
-                        ethereum_count = stats.get('chains', {}).get('ethereum', 0)
-                        st.metric("Ethereum Contracts", ethereum_count)
-                    
-                    with col3:
-                        base_count = stats.get('chains', {}).get('base', 0)
-                        st.metric("Base Contracts", base_count)
-                    
-                    if stats.get('last_updated'):
-                        st.write(f"**Last Updated:** {stats['last_updated'][:19].replace('T', ' ')}")
-                        
+                    self._render_repo_stats()
                 except Exception as e:
                     st.error(f"Error loading repository statistics: {str(e)}")
         else:
@@ -653,7 +798,7 @@ class Web3LOCApp:
         
         with col2:
             if st.button("📊 Database Statistics"):
-                stats = self.db.get_statistics()
+                stats = _cached_stats(_db_cache_key(self.db.db_path))
                 st.json(stats)
         
         # Export/Import
@@ -668,25 +813,48 @@ class Web3LOCApp:
             else:
                 st.error("❌ Export failed")
     
+    @staticmethod
+    def _github_configured() -> bool:
+        """Check whether GitHub storage credentials are configured.
+
+        Checks the token directly rather than is_available(), which also
+        requires an open session the cached storage only creates lazily.
+        """
+        return bool(os.getenv('GITHUB_TOKEN'))
+
+    def _render_repo_stats(self) -> None:
+        """Render the repository statistics block from the cached stats."""
+        stats = _cached_repo_stats()
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Total Contracts", stats.get('total_contracts', 0))
+
+        with col2:
+            ethereum_count = stats.get('chains', {}).get('ethereum', 0)
+            st.metric("Ethereum Contracts", ethereum_count)
+
+        with col3:
+            base_count = stats.get('chains', {}).get('base', 0)
+            st.metric("Base Contracts", base_count)
+
+        if stats.get('last_updated'):
+            st.write(f"**Last Updated:** {stats['last_updated'][:19].replace('T', ' ')}")
+
     def _test_api_connections(self) -> Dict[str, Any]:
         """Test API connections."""
-        loop = None
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            self.client_manager = BlockchainClientManager()
-            loop.run_until_complete(self.client_manager.initialize())
-            
+            loop, self.client_manager = get_client_manager()
             connected_chains = self.client_manager.get_available_chains()
-            
+
             return {
                 'success': len(connected_chains) > 0,
                 'connected_chains': len(connected_chains),
                 'chains': connected_chains,
                 'error': None
             }
-            
+
         except Exception as e:
             return {
                 'success': False,
@@ -694,55 +862,51 @@ class Web3LOCApp:
                 'chains': [],
                 'error': str(e)
             }
-        finally:
-            if self.client_manager and loop:
-                loop.run_until_complete(self.client_manager.cleanup())
-    
+
     def _run_discovery(self, chains: List[str], limit: int) -> tuple[int, int]:
         """Run contract discovery process."""
-        loop = None
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            self.client_manager = BlockchainClientManager()
-            loop.run_until_complete(self.client_manager.initialize())
-            
+            loop, self.client_manager = get_client_manager()
+
             all_contracts = loop.run_until_complete(
                 self.client_manager.get_all_verified_contracts(limit_per_chain=limit)
             )
             
-            success_count = 0
-            error_count = 0
-            
-            for contract in all_contracts:
-                try:
-                    # Generate contract summary
-                    summary = ContractAnalyzer.analyze_contract(contract)
-                    
-                    # Insert into database
-                    if self.db.insert_contract(contract, summary):
-                        success_count += 1
-                    else:
-                        error_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error processing contract {contract.address}: {str(e)}")
-                    error_count += 1
-            
-            return success_count, error_count
+            # Summary generation is pure CPU work over the source text;
+            # for large batches spread it across cores. Worker startup
+            # and pickling only amortize beyond a few dozen contracts,
+            # so small batches stay on the single-process path.
+            if len(all_contracts) >= 32:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    summaries = list(executor.map(
+                        ContractAnalyzer.analyze_contract, all_contracts, chunksize=8
+                    ))
+            else:
+                summaries = [ContractAnalyzer.analyze_contract(c) for c in all_contracts]
+
+            rows = list(zip(all_contracts, summaries))
+
+            # One transaction for the whole batch instead of a commit per row
+            inserted, skipped = self.db.insert_contracts_bulk(rows)
+            return inserted, skipped
             
         except Exception as e:
             logger.error(f"Discovery failed: {str(e)}")
             return 0, 1
-        finally:
-            if self.client_manager and loop:
-                loop.run_until_complete(self.client_manager.cleanup())
+
+@st.cache_resource(show_spinner=False)
+def get_app() -> Web3LOCApp:
+    """Get the long-lived application instance.
+
+    Streamlit re-executes this module on every widget interaction;
+    without the cache each rerun re-opened the SQLite connection (and
+    formerly rebuilt the storage manager) just to render the page.
+    """
+    return Web3LOCApp()
 
 def main():
     """Main entry point for the Streamlit app."""
-    app = Web3LOCApp()
-    app.run()
+    get_app().run()
 
 if __name__ == "__main__":
     main()